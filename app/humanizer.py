@@ -99,6 +99,10 @@ PUNCHY_REPLACEMENTS = {
     "it should be noted": ["note:", "btw"],
 }
 
+# Common function words used to guess the text language
+_INDO_WORDS = frozenset(["yang", "dan", "ini", "itu", "untuk", "dengan", "tidak", "dari", "ke", "di"])
+_ENG_WORDS = frozenset(["the", "and", "is", "are", "to", "for", "with", "you", "your", "this"])
+
 
 class Humanizer:
     """
@@ -120,14 +124,9 @@ class Humanizer:
 
     def detect_language(self, text: str) -> str:
         """Detect if text is primarily Indonesian or English."""
-        indo_words = ["yang", "dan", "ini", "itu", "untuk", "dengan", "tidak", "dari", "ke", "di"]
-        eng_words = ["the", "and", "is", "are", "to", "for", "with", "you", "your", "this"]
-
-        text_lower = text.lower()
-        indo_count = sum(1 for word in indo_words if f" {word} " in f" {text_lower} ")
-        eng_count = sum(1 for word in eng_words if f" {word} " in f" {text_lower} ")
-
-        return "indonesian" if indo_count > eng_count else "english"
+        # Space-delimited tokens, matching the old f" {word} " substring check
+        tokens = set(text.lower().split(" "))
+        return "indonesian" if len(tokens & _INDO_WORDS) > len(tokens & _ENG_WORDS) else "english"
 
     def calculate_human_score(self, text: str) -> Dict[str, any]:
         """
@@ -19,6 +19,10 @@ from .ai_client import get_ai_client
 from .meme_matcher import EMOTION_MEME_MATRIX, TOPIC_MEME_MATRIX
 
 
+# Greedy match of the outermost JSON object in an AI response
+_JSON_BLOCK_RE = re.compile(r'\{[\s\S]*\}')
+
+
 # ============================================================================
 # MEME TWIST TEMPLATES - For genuinely funny content
 # ============================================================================
@@ -249,7 +253,7 @@ Some slides work better text-only. Don't force memes where they don't fit.
                 temperature=0.7  # Higher for more creative twists
             )
 
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 result = json.loads(json_match.group())
                 return result.get("slides", [])
@@ -323,7 +327,7 @@ Return ONLY JSON with the meme content:
                 temperature=0.85  # High for creative humor
             )
 
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 return json.loads(json_match.group())
 
@@ -430,7 +434,7 @@ Provide in JSON:
                 temperature=0.3
             )
 
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 return json.loads(json_match.group())
 
@@ -650,7 +654,7 @@ JSON format:
                 temperature=0.6
             )
 
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 result = json.loads(json_match.group())
                 return result.get("suggestions", [])
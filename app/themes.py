@@ -5,7 +5,9 @@ Provides multiple professional themes with color palettes optimized for Instagra
 Includes: Dark (Economic Influence), Gradient (Modern), Minimal (Clean), and more.
 """
 
-from typing import Dict, Any, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 
 # ============================================================================
@@ -165,6 +167,38 @@ THEMES: Dict[str, Dict[str, Any]] = {
 THEMES["light"] = THEMES["minimal"]
 
 
+@dataclass(frozen=True)
+class Theme:
+    """Immutable, attribute-access view of a THEMES entry."""
+    name: str
+    description: str
+    background: str
+    background_secondary: str
+    background_gradient: Optional[Tuple[str, ...]]
+    text_primary: str
+    text_secondary: str
+    accent: str
+    accent_secondary: str
+    highlight_bg: str
+    highlight_text: str
+    muted: str
+    success: str
+    swipe_indicator: str
+    border_color: str
+    shadow: bool
+    overlay_opacity: float
+
+
+def _freeze_theme(theme: Dict[str, Any]) -> Theme:
+    """Build a Theme from a THEMES dict, turning the gradient list into a tuple."""
+    gradient = theme["background_gradient"]
+    return Theme(**{**theme, "background_gradient": tuple(gradient) if gradient else None})
+
+
+# Built once at import so get_theme() never rebuilds or copies a palette
+FROZEN_THEMES: Dict[str, Theme] = {name: _freeze_theme(theme) for name, theme in THEMES.items()}
+
+
 # ============================================================================
 # TYPOGRAPHY SETTINGS
 # ============================================================================
@@ -283,9 +317,9 @@ SLIDE_TEMPLATES = {
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_theme(theme_name: str = "dark") -> Dict[str, Any]:
-    """Get theme by name, defaults to dark."""
-    return THEMES.get(theme_name, THEMES["dark"])
+def get_theme(theme_name: str = "dark") -> Theme:
+    """Get frozen theme by name, defaults to dark."""
+    return FROZEN_THEMES.get(theme_name, FROZEN_THEMES["dark"])
 
 
 def get_all_themes() -> Dict[str, Dict[str, Any]]:
@@ -307,6 +341,7 @@ def get_theme_display_options() -> List[Dict[str, str]]:
     ]
 
 
+@lru_cache(maxsize=512)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
@@ -332,17 +367,32 @@ def get_gradient_colors(gradient: List[str], steps: int) -> List[str]:
     if not gradient or len(gradient) < 2:
         return [gradient[0]] * steps if gradient else ["#000000"] * steps
 
+    # Same theme renders the same gradient for every slide, so memoize on a
+    # hashable copy and hand back a fresh list each time
+    return list(_build_gradient_colors(tuple(gradient), steps))
+
+
+@lru_cache(maxsize=32)
+def _build_gradient_colors(gradient: Tuple[str, ...], steps: int) -> Tuple[str, ...]:
+    """Cached worker for get_gradient_colors."""
     colors = []
     segments = len(gradient) - 1
     steps_per_segment = steps // segments
 
     for i in range(segments):
+        # Parse each segment's endpoints once instead of per step
+        r1, g1, b1 = hex_to_rgb(gradient[i])
+        r2, g2, b2 = hex_to_rgb(gradient[i + 1])
+        dr, dg, db = r2 - r1, g2 - g1, b2 - b1
+
         for j in range(steps_per_segment):
             factor = j / steps_per_segment
-            colors.append(interpolate_color(gradient[i], gradient[i + 1], factor))
+            colors.append('#{:02x}{:02x}{:02x}'.format(
+                int(r1 + dr * factor), int(g1 + dg * factor), int(b1 + db * factor)
+            ))
 
     # Fill remaining steps
     while len(colors) < steps:
         colors.append(gradient[-1])
 
-    return colors[:steps]
+    return tuple(colors[:steps])
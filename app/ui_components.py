@@ -1,19 +1,50 @@
 """
 Production-Grade UI Components - Distinctive Design System
 Bold, minimalist interface with sophisticated typography and interactions.
-"""
 
-import streamlit as st
+The stylesheet is rendered with st.html (Streamlit >= 1.33), which skips
+the markdown parser; older releases fall back to st.markdown.
+"""
 
+import re
+from functools import lru_cache
+from string import Template
 
-def inject_custom_css():
-    """Inject production-grade CSS with distinctive aesthetics."""
-    st.markdown("""
-    <style>
-    /* ===== TYPOGRAPHY - Distinctive Choices ===== */
-    /* Using Space Grotesk (startup/modern) + Fira Code (technical) */
-    @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=Fira+Code:wght@400;500;600&family=Fraunces:wght@300;400;600;700;900&display=swap');
+import streamlit as st
 
+from .themes import hex_to_rgb
+
+
+# Only the families and weights the stylesheet actually renders:
+# Fraunces (--font-heading) at 400/700/900, Fira Code (--font-mono) at 400/700
+_GOOGLE_FONTS_URL = (
+    "https://fonts.googleapis.com/css2"
+    "?family=Fira+Code:wght@400;700"
+    "&family=Fraunces:wght@400;700;900"
+    "&display=swap"
+)
+
+# Linked separately instead of @import-ed, so the stylesheet below no longer
+# waits on the fonts CSS before it can apply
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="{_GOOGLE_FONTS_URL}">'
+)
+
+# Brand colours substituted into the $placeholders of _RAW_CSS; *_rgb
+# triplets for the rgba() tints are derived from these in _build_stylesheet
+_DESIGN_TOKENS = {
+    "default": {
+        "accent": "#10B981",
+        "accent_dark": "#059669",
+        "accent_darker": "#047857",
+        "amber": "#F59E0B",
+    },
+}
+
+# Source stylesheet template, kept readable; built and minified once at import
+_RAW_CSS = """
     /* ===== DESIGN TOKENS ===== */
     :root {
         /* Pure Monochrome */
@@ -26,53 +57,43 @@ def inject_custom_css():
         --gray-200: #E4E4E7;
         --gray-300: #D4D4D8;
         --gray-400: #A1A1AA;
-        --gray-500: #71717A;
         --gray-600: #52525B;
-        --gray-700: #3F3F46;
-        --gray-800: #27272A;
         --gray-900: #18181B;
 
         /* Accent Colors - Distinctive Palette (Emerald & Amber - High Contrast) */
-        --accent-primary: #10B981;
-        --accent-secondary: #F59E0B;
-        --accent-tertiary: #EC4899;
-        --accent-gradient: linear-gradient(135deg, #10B981 0%, #059669 100%);
-        --accent-glow: radial-gradient(circle, rgba(16, 185, 129, 0.2) 0%, transparent 70%);
+        --accent-gradient: linear-gradient(135deg, $accent 0%, $accent_dark 100%);
+        --accent-gradient-hover: linear-gradient(135deg, $accent_dark 0%, $accent_darker 100%);
+        --accent-gradient-horizontal: linear-gradient(90deg, $accent 0%, $accent_dark 100%);
 
         /* Semantic Colors */
         --surface-primary: var(--pure-white);
         --surface-secondary: var(--gray-50);
-        --surface-elevated: var(--pure-white);
         --surface-overlay: rgba(0, 0, 0, 0.02);
 
         --text-primary: var(--gray-900);
         --text-secondary: var(--gray-600);
         --text-tertiary: var(--gray-400);
-        --text-inverse: var(--pure-white);
 
         --border-subtle: var(--gray-200);
         --border-default: var(--gray-300);
         --border-strong: var(--gray-400);
-        --border-accent: var(--pure-black);
 
         /* Typography Scale - Distinctive Fonts */
-        --font-display: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
         --font-heading: 'Fraunces', Georgia, serif;
         --font-mono: 'Fira Code', 'Courier New', monospace;
+        --font-system: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
 
         --text-xs: 0.6875rem;    /* 11px */
         --text-sm: 0.8125rem;    /* 13px */
         --text-base: 0.9375rem;  /* 15px */
         --text-lg: 1.125rem;     /* 18px */
         --text-xl: 1.5rem;       /* 24px */
-        --text-2xl: 2rem;        /* 32px */
 
         /* Spacing Scale */
         --space-1: 0.25rem;
         --space-2: 0.5rem;
         --space-3: 0.75rem;
         --space-4: 1rem;
-        --space-5: 1.25rem;
         --space-6: 1.5rem;
         --space-8: 2rem;
         --space-10: 2.5rem;
@@ -87,12 +108,11 @@ def inject_custom_css():
         --shadow-xs: 0 1px 2px rgba(0, 0, 0, 0.02);
         --shadow-sm: 0 1px 3px rgba(0, 0, 0, 0.04);
         --shadow-md: 0 2px 6px rgba(0, 0, 0, 0.06);
-        --shadow-lg: 0 4px 12px rgba(0, 0, 0, 0.08);
 
         /* Transitions */
-        --transition-fast: 120ms cubic-bezier(0.4, 0, 0.2, 1);
-        --transition-base: 200ms cubic-bezier(0.4, 0, 0.2, 1);
-        --transition-slow: 300ms cubic-bezier(0.4, 0, 0.2, 1);
+        --ease-standard: cubic-bezier(0.4, 0, 0.2, 1);
+        --transition-fast: 120ms var(--ease-standard);
+        --transition-base: 200ms var(--ease-standard);
     }
 
     /* ===== GLOBAL RESETS ===== */
@@ -116,11 +136,23 @@ def inject_custom_css():
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
 
+    /* Spotlight templates - declared on each consumer (not :root) so the
+       var() references resolve against that element's own --spot-* values */
+    .stApp,
+    .studio-header {
+        --spotlight-emerald: radial-gradient(circle at var(--spot-emerald-at), rgba($accent_rgb, var(--spot-emerald-alpha)) 0%, transparent 50%);
+        --spotlight-amber: radial-gradient(circle at var(--spot-amber-at), rgba($amber_rgb, var(--spot-amber-alpha)) 0%, transparent 50%);
+    }
+
     .stApp {
+        --spot-emerald-at: 20% 80%;
+        --spot-emerald-alpha: 0.03;
+        --spot-amber-at: 80% 20%;
+        --spot-amber-alpha: 0.02;
         background:
-            radial-gradient(circle at 20% 80%, rgba(16, 185, 129, 0.03) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(245, 158, 11, 0.02) 0%, transparent 50%),
-            url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%2310B981' fill-opacity='0.02'%3E%3Cpath d='M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E"),
+            var(--spotlight-emerald),
+            var(--spotlight-amber),
+            url('./app/static/bg-pattern.png'),
             #FAFAFA;
         background-attachment: fixed;
     }
@@ -130,9 +162,9 @@ def inject_custom_css():
         visibility: visible !important;
         display: flex !important;
         opacity: 1 !important;
-        background: linear-gradient(135deg, #10B981 0%, #059669 100%) !important;
+        background: var(--accent-gradient) !important;
         color: var(--pure-white) !important;
-        border: 1px solid #10B981 !important;
+        border: 1px solid $accent !important;
         border-left: none !important;
         border-radius: 0 8px 8px 0 !important;
         padding: var(--space-4) var(--space-3) !important;
@@ -143,17 +175,13 @@ def inject_custom_css():
         z-index: 999999 !important;
         cursor: pointer !important;
         transition: all var(--transition-base) !important;
-        box-shadow:
-            0 4px 12px rgba(16, 185, 129, 0.3),
-            0 1px 3px rgba(0, 0, 0, 0.2) !important;
+        box-shadow: 0 4px 12px rgba($accent_rgb, 0.35) !important;
     }
 
     [data-testid="collapsedControl"]:hover {
-        background: linear-gradient(135deg, #059669 0%, #047857 100%) !important;
+        background: var(--accent-gradient-hover) !important;
         transform: translateY(-50%) translateX(4px) !important;
-        box-shadow:
-            0 6px 20px rgba(16, 185, 129, 0.4),
-            0 2px 6px rgba(0, 0, 0, 0.2) !important;
+        box-shadow: 0 6px 20px rgba($accent_rgb, 0.45) !important;
     }
 
     [data-testid="collapsedControl"]:active {
@@ -222,14 +250,14 @@ def inject_custom_css():
         border-right: 1px solid rgba(0, 0, 0, 0.06) !important;
         padding: 0 !important;
         position: relative;
-    }
 
-    [data-testid="stSidebar"] > div:first-child {
-        padding: 1rem 1rem 2rem 1rem !important;
-    }
+        & > div:first-child {
+            padding: 1rem 1rem 2rem 1rem !important;
+        }
 
-    [data-testid="stSidebar"] .block-container {
-        padding: 0 !important;
+        & .block-container {
+            padding: 0 !important;
+        }
     }
 
     /* Modern Section Cards */
@@ -244,7 +272,7 @@ def inject_custom_css():
     }
 
     .sidebar-section:hover {
-        border-color: rgba(16, 185, 129, 0.2);
+        border-color: rgba($accent_rgb, 0.2);
         box-shadow: 0 4px 12px rgba(0, 0, 0, 0.06);
     }
 
@@ -260,7 +288,7 @@ def inject_custom_css():
     .sidebar-section-icon {
         width: 28px;
         height: 28px;
-        background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+        background: var(--accent-gradient);
         border-radius: 8px;
         display: flex;
         align-items: center;
@@ -305,14 +333,14 @@ def inject_custom_css():
 
     .quick-action-pill:hover {
         background: #F1F5F9;
-        border-color: rgba(16, 185, 129, 0.2);
+        border-color: rgba($accent_rgb, 0.2);
         transform: translateY(-1px);
     }
 
     .quick-action-pill.active {
-        background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-        border-color: #10B981;
-        box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);
+        background: linear-gradient(135deg, rgba($accent_rgb, 0.1) 0%, rgba($accent_dark_rgb, 0.1) 100%);
+        border-color: $accent;
+        box-shadow: 0 0 0 3px rgba($accent_rgb, 0.1);
     }
 
     .quick-action-pill .pill-icon {
@@ -327,7 +355,7 @@ def inject_custom_css():
     }
 
     .quick-action-pill.active .pill-label {
-        color: #059669;
+        color: $accent_dark;
         font-weight: 600;
     }
 
@@ -353,8 +381,8 @@ def inject_custom_css():
     }
 
     .theme-chip.active {
-        border-color: #10B981;
-        box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.2);
+        border-color: $accent;
+        box-shadow: 0 0 0 3px rgba($accent_rgb, 0.2);
     }
 
     .theme-chip.active::after {
@@ -364,7 +392,7 @@ def inject_custom_css():
         right: 4px;
         width: 14px;
         height: 14px;
-        background: #10B981;
+        background: $accent;
         border-radius: 50%;
         display: flex;
         align-items: center;
@@ -372,62 +400,64 @@ def inject_custom_css():
     }
 
     /* Sidebar headings - Modern style */
-    [data-testid="stSidebar"] h1,
-    [data-testid="stSidebar"] h2,
-    [data-testid="stSidebar"] h3 {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        font-size: 0.6875rem !important;
-        font-weight: 600 !important;
-        color: #94A3B8 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.08em !important;
-        margin: 1rem 0 0.5rem 0 !important;
-        line-height: 1.4 !important;
-    }
+    [data-testid="stSidebar"] {
+        & h1,
+        & h2,
+        & h3 {
+            font-family: var(--font-system) !important;
+            font-size: 0.6875rem !important;
+            font-weight: 600 !important;
+            color: #94A3B8 !important;
+            text-transform: uppercase !important;
+            letter-spacing: 0.08em !important;
+            margin: 1rem 0 0.5rem 0 !important;
+            line-height: 1.4 !important;
+        }
 
-    /* Sidebar text */
-    [data-testid="stSidebar"] label,
-    [data-testid="stSidebar"] p {
-        color: var(--text-primary) !important;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        font-size: 0.8125rem !important;
-        line-height: 1.5 !important;
-    }
+        /* Sidebar text */
+        & label,
+        & p {
+            color: var(--text-primary) !important;
+            font-family: var(--font-system) !important;
+            font-size: 0.8125rem !important;
+            line-height: 1.5 !important;
+        }
 
-    /* Use system fonts in sidebar */
-    [data-testid="stSidebar"] * {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-    }
+        /* Use system fonts in sidebar */
+        & * {
+            font-family: var(--font-system) !important;
+        }
 
-    /* Modern Input Fields */
-    [data-testid="stSidebar"] [data-baseweb="select"] > div {
-        background-color: #F8FAFC !important;
-        border: 1px solid rgba(0, 0, 0, 0.08) !important;
-        border-radius: 10px !important;
-        color: var(--gray-900) !important;
-        font-size: 0.8125rem !important;
-        transition: all 0.15s ease !important;
-        min-height: 40px !important;
-    }
+        /* Modern Input Fields */
+        & [data-baseweb="select"] > div {
+            background-color: #F8FAFC !important;
+            border: 1px solid rgba(0, 0, 0, 0.08) !important;
+            border-radius: 10px !important;
+            color: var(--gray-900) !important;
+            font-size: 0.8125rem !important;
+            transition: all 0.15s ease !important;
+            min-height: 40px !important;
+        }
 
-    [data-testid="stSidebar"] [data-baseweb="select"]:hover > div {
-        border-color: rgba(16, 185, 129, 0.3) !important;
-        background-color: var(--pure-white) !important;
-    }
+        & [data-baseweb="select"]:hover > div {
+            border-color: rgba($accent_rgb, 0.3) !important;
+            background-color: var(--pure-white) !important;
+        }
 
-    [data-testid="stSidebar"] [data-baseweb="select"]:focus-within > div {
-        border-color: #10B981 !important;
-        box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1) !important;
-    }
+        & [data-baseweb="select"]:focus-within > div {
+            border-color: $accent !important;
+            box-shadow: 0 0 0 3px rgba($accent_rgb, 0.1) !important;
+        }
 
-    /* Sidebar select text visibility */
-    [data-testid="stSidebar"] [data-baseweb="select"] span {
-        color: var(--gray-900) !important;
-        font-weight: 500 !important;
-    }
+        /* Sidebar select text visibility */
+        & [data-baseweb="select"] span {
+            color: var(--gray-900) !important;
+            font-weight: 500 !important;
+        }
 
-    [data-testid="stSidebar"] [data-baseweb="select"] div {
-        color: var(--gray-900) !important;
+        & [data-baseweb="select"] div {
+            color: var(--gray-900) !important;
+        }
     }
 
     /* Status Indicator Dots */
@@ -440,8 +470,8 @@ def inject_custom_css():
     }
 
     .status-dot.online {
-        background: #10B981;
-        box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.2);
+        background: $accent;
+        box-shadow: 0 0 0 3px rgba($accent_rgb, 0.2);
     }
 
     .status-dot.offline {
@@ -505,95 +535,99 @@ def inject_custom_css():
     }
 
     [aria-selected="true"][role="option"] {
-        background-color: rgba(16, 185, 129, 0.1) !important;
+        background-color: rgba($accent_rgb, 0.1) !important;
         color: var(--gray-900) !important;
         font-weight: 600 !important;
     }
 
     /* Sidebar dropdown - fix black background issue */
-    [data-testid="stSidebar"] [role="listbox"] {
-        background-color: var(--pure-white) !important;
-    }
+    [data-testid="stSidebar"] {
+        & [role="listbox"] {
+            background-color: var(--pure-white) !important;
+        }
 
-    [data-testid="stSidebar"] [role="listbox"] [role="option"] {
-        background-color: var(--pure-white) !important;
-        color: #1E293B !important;
-    }
+        & [role="listbox"] [role="option"] {
+            background-color: var(--pure-white) !important;
+            color: #1E293B !important;
+        }
 
-    [data-testid="stSidebar"] [role="listbox"] [role="option"]:hover {
-        background-color: #F1F5F9 !important;
-        color: #1E293B !important;
-    }
+        & [role="listbox"] [role="option"]:hover {
+            background-color: #F1F5F9 !important;
+            color: #1E293B !important;
+        }
 
-    /* Sidebar captions - better spacing */
-    [data-testid="stSidebar"] .stCaption {
-        margin-top: 0.25rem !important;
-        margin-bottom: 1rem !important;
-        font-size: 0.6875rem !important;
-        color: var(--text-secondary) !important;
-        line-height: 1.4 !important;
-        display: block !important;
-    }
+        /* Sidebar captions - better spacing */
+        & .stCaption {
+            margin-top: 0.25rem !important;
+            margin-bottom: 1rem !important;
+            font-size: 0.6875rem !important;
+            color: var(--text-secondary) !important;
+            line-height: 1.4 !important;
+            display: block !important;
+        }
 
-    /* Fix overlapping text in sidebar */
-    [data-testid="stSidebar"] > div > div {
-        overflow-y: auto !important;
-        overflow-x: hidden !important;
-    }
+        /* Fix overlapping text in sidebar */
+        & > div > div {
+            overflow-y: auto !important;
+            overflow-x: hidden !important;
+        }
 
-    /* Fix dropdown arrow overlapping with text */
-    [data-testid="stSidebar"] [data-baseweb="select"] {
-        position: relative !important;
-    }
+        /* Fix dropdown arrow overlapping with text */
+        & [data-baseweb="select"] {
+            position: relative !important;
+        }
 
-    [data-testid="stSidebar"] [data-baseweb="select"] > div {
-        padding-right: 2.5rem !important; /* Extra space for arrow */
-    }
+        & [data-baseweb="select"] > div {
+            padding-right: 2.5rem !important; /* Extra space for arrow */
+        }
 
-    /* Position dropdown arrow properly */
-    [data-testid="stSidebar"] [data-baseweb="select"] svg {
-        position: absolute !important;
-        right: 0.75rem !important;
-        top: 50% !important;
-        transform: translateY(-50%) !important;
-        pointer-events: none !important;
-    }
+        /* Position dropdown arrow properly */
+        & [data-baseweb="select"] svg {
+            position: absolute !important;
+            right: 0.75rem !important;
+            top: 50% !important;
+            transform: translateY(-50%) !important;
+            pointer-events: none !important;
+        }
 
-    /* Ensure text doesn't overlap with arrow */
-    [data-testid="stSidebar"] [data-baseweb="select"] [data-baseweb="select-value"] {
-        max-width: calc(100% - 2rem) !important;
-        overflow: hidden !important;
-        text-overflow: ellipsis !important;
-        white-space: nowrap !important;
-    }
+        /* Ensure text doesn't overlap with arrow */
+        & [data-baseweb="select"] [data-baseweb="select-value"] {
+            max-width: calc(100% - 2rem) !important;
+            overflow: hidden !important;
+            text-overflow: ellipsis !important;
+            white-space: nowrap !important;
+        }
 
-    /* Sidebar text elements - prevent overlap */
-    [data-testid="stSidebar"] label {
-        display: block !important;
-        margin-bottom: 0.5rem !important;
-        line-height: 1.4 !important;
-    }
+        /* Sidebar text elements - prevent overlap */
+        & label {
+            display: block !important;
+            margin-bottom: 0.5rem !important;
+            line-height: 1.4 !important;
+        }
 
-    /* Sidebar form elements spacing */
-    [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div {
-        margin-bottom: 1rem !important;
+        /* Sidebar form elements spacing */
+        & [data-testid="stVerticalBlock"] > div {
+            margin-bottom: 1rem !important;
+        }
     }
 
     /* ===== HEADER - Distinctive Dark Hero with Emerald Accents ===== */
     .studio-header {
+        --spot-emerald-at: top right;
+        --spot-emerald-alpha: 0.15;
+        --spot-amber-at: bottom left;
+        --spot-amber-alpha: 0.08;
         background:
-            radial-gradient(circle at top right, rgba(16, 185, 129, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at bottom left, rgba(245, 158, 11, 0.08) 0%, transparent 50%),
+            var(--spotlight-emerald),
+            var(--spotlight-amber),
             linear-gradient(135deg, #0A0A0A 0%, #18181B 50%, #27272A 100%);
         border-radius: 12px;
         padding: 4rem 3rem;
         margin-bottom: var(--space-8);
         position: relative;
         overflow: hidden;
-        border: 1px solid rgba(16, 185, 129, 0.2);
-        box-shadow:
-            0 20px 60px rgba(0, 0, 0, 0.3),
-            inset 0 1px 0 rgba(255, 255, 255, 0.05);
+        border: 1px solid rgba($accent_rgb, 0.2);
+        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
     }
 
     .studio-header::before {
@@ -603,9 +637,8 @@ def inject_custom_css():
         right: -100px;
         width: 400px;
         height: 400px;
-        background: radial-gradient(circle, rgba(16, 185, 129, 0.2) 0%, transparent 60%);
+        background: radial-gradient(circle, rgba($accent_rgb, 0.2) 0%, transparent 60%);
         pointer-events: none;
-        animation: float 8s ease-in-out infinite;
     }
 
     .studio-header::after {
@@ -615,14 +648,8 @@ def inject_custom_css():
         left: -80px;
         width: 300px;
         height: 300px;
-        background: radial-gradient(circle, rgba(245, 158, 11, 0.12) 0%, transparent 60%);
+        background: radial-gradient(circle, rgba($amber_rgb, 0.12) 0%, transparent 60%);
         pointer-events: none;
-        animation: float 10s ease-in-out infinite reverse;
-    }
-
-    @keyframes float {
-        0%, 100% { transform: translate(0, 0) scale(1); }
-        50% { transform: translate(30px, 30px) scale(1.1); }
     }
 
     .studio-header h1 {
@@ -630,7 +657,7 @@ def inject_custom_css():
         font-weight: 900 !important;
         margin: 0 0 1rem 0 !important;
         letter-spacing: -0.05em !important;
-        background: linear-gradient(135deg, #FFFFFF 0%, #10B981 100%);
+        background: linear-gradient(135deg, #FFFFFF 0%, $accent 100%);
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
         background-clip: text;
@@ -664,15 +691,14 @@ def inject_custom_css():
         display: inline-flex;
         align-items: center;
         gap: var(--space-2);
-        background: rgba(16, 185, 129, 0.1);
-        backdrop-filter: blur(10px);
+        background: rgba($accent_rgb, 0.18);
         padding: 0.5rem 1rem;
         border-radius: var(--radius-full);
         font-size: var(--text-xs);
         font-weight: 600;
         margin-top: var(--space-4);
-        color: #10B981 !important;
-        border: 1px solid rgba(16, 185, 129, 0.3);
+        color: $accent !important;
+        border: 1px solid rgba($accent_rgb, 0.3);
         position: relative;
         z-index: 1;
         animation: fadeSlideUp 0.8s ease-out 0.2s backwards;
@@ -680,8 +706,8 @@ def inject_custom_css():
     }
 
     .header-badge:hover {
-        background: rgba(16, 185, 129, 0.15);
-        border-color: rgba(16, 185, 129, 0.5);
+        background: rgba($accent_rgb, 0.24);
+        border-color: rgba($accent_rgb, 0.5);
         transform: translateY(-2px);
     }
 
@@ -698,123 +724,104 @@ def inject_custom_css():
         box-shadow: var(--shadow-xs);
         position: relative;
         min-height: 38px;
-    }
-
-    .stButton > button:hover {
-        background: var(--surface-secondary);
-        border-color: var(--border-strong);
-        transform: translateY(-1px);
-        box-shadow: var(--shadow-sm);
-    }
-
-    .stButton > button:active {
-        transform: translateY(0);
-        box-shadow: none;
-    }
 
-    /* Secondary buttons */
-    .stButton > button[kind="secondary"] {
-        background: var(--surface-primary);
-        border: 1.5px solid var(--border-default);
-        color: var(--text-primary);
-    }
+        &:hover {
+            background: var(--surface-secondary);
+            border-color: var(--border-strong);
+            transform: translateY(-1px);
+            box-shadow: var(--shadow-sm);
+        }
 
-    .stButton > button[kind="secondary"]:hover {
-        border-color: var(--pure-black);
-        background: var(--gray-50);
-    }
+        &:active {
+            transform: translateY(0);
+            box-shadow: none;
+        }
 
-    /* Primary Button - Emerald Gradient with Glow */
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-        border: 1.5px solid #10B981;
-        color: var(--pure-white);
-        box-shadow:
-            0 4px 12px rgba(16, 185, 129, 0.3),
-            0 1px 3px rgba(0, 0, 0, 0.2);
-        font-weight: 600;
-        position: relative;
-        overflow: hidden;
-    }
+        /* Secondary buttons */
+        &[kind="secondary"] {
+            background: var(--surface-primary);
+            border: 1.5px solid var(--border-default);
+            color: var(--text-primary);
+        }
 
-    .stButton > button[kind="primary"]::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        transition: left 0.5s;
-    }
+        &[kind="secondary"]:hover {
+            border-color: var(--pure-black);
+            background: var(--gray-50);
+        }
 
-    .stButton > button[kind="primary"]:hover::before {
-        left: 100%;
-    }
+        /* Primary Button - Emerald Gradient with Glow */
+        &[kind="primary"] {
+            background: var(--accent-gradient);
+            border: 1.5px solid $accent;
+            color: var(--pure-white);
+            box-shadow: 0 4px 12px rgba($accent_rgb, 0.35);
+            font-weight: 600;
+            position: relative;
+            overflow: hidden;
+        }
 
-    .stButton > button[kind="primary"]:hover {
-        background: linear-gradient(135deg, #059669 0%, #047857 100%);
-        border-color: #059669;
-        box-shadow:
-            0 6px 20px rgba(16, 185, 129, 0.4),
-            0 2px 6px rgba(0, 0, 0, 0.2);
-        transform: translateY(-2px);
-    }
+        &[kind="primary"]:hover {
+            background: var(--accent-gradient-hover);
+            border-color: $accent_dark;
+            box-shadow: 0 6px 20px rgba($accent_rgb, 0.45);
+            transform: translateY(-2px);
+        }
 
-    .stButton > button[kind="primary"]:active {
-        transform: translateY(0);
-        box-shadow:
-            0 2px 8px rgba(16, 185, 129, 0.3),
-            0 1px 3px rgba(0, 0, 0, 0.2);
+        &[kind="primary"]:active {
+            transform: translateY(0);
+            box-shadow: 0 2px 8px rgba($accent_rgb, 0.35);
+        }
     }
 
     /* Sidebar preset buttons - Modern icon style */
-    [data-testid="stSidebar"] .stButton > button {
-        padding: 0.625rem;
-        font-size: 1.25rem;
-        min-height: 48px;
-        aspect-ratio: 1;
-        border-radius: 12px;
-    }
+    [data-testid="stSidebar"] {
+        & .stButton > button {
+            padding: 0.625rem;
+            font-size: 1.25rem;
+            min-height: 48px;
+            aspect-ratio: 1;
+            border-radius: 12px;
+        }
 
-    [data-testid="stSidebar"] .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-        border: 2px solid #10B981;
-        transform: scale(1.05);
-    }
+        & .stButton > button[kind="primary"] {
+            background: var(--accent-gradient);
+            border: 2px solid $accent;
+            transform: scale(1.05);
+        }
 
-    [data-testid="stSidebar"] .stButton > button[kind="secondary"] {
-        background: #F8FAFC;
-        border: 1px solid rgba(0, 0, 0, 0.08);
-        color: #64748B;
-    }
+        & .stButton > button[kind="secondary"] {
+            background: #F8FAFC;
+            border: 1px solid rgba(0, 0, 0, 0.08);
+            color: #64748B;
+        }
 
-    [data-testid="stSidebar"] .stButton > button[kind="secondary"]:hover {
-        background: #F1F5F9;
-        border-color: rgba(16, 185, 129, 0.2);
-    }
+        & .stButton > button[kind="secondary"]:hover {
+            background: #F1F5F9;
+            border-color: rgba($accent_rgb, 0.2);
+        }
 
-    /* Modern Toggle Switches - Fix vertical text issue */
-    [data-testid="stSidebar"] .stCheckbox,
-    [data-testid="stSidebar"] [data-testid="stCheckbox"] {
-        background: transparent;
-        padding: 0;
-    }
+        /* Modern Toggle Switches - Fix vertical text issue */
+        & .stCheckbox,
+        & [data-testid="stCheckbox"] {
+            background: transparent;
+            padding: 0;
+        }
 
-    /* Toggle label text - ensure horizontal display */
-    [data-testid="stSidebar"] [data-testid="stCheckbox"] label,
-    [data-testid="stSidebar"] .stCheckbox label {
-        display: flex !important;
-        flex-direction: row !important;
-        align-items: center !important;
-        gap: 0.5rem !important;
-        white-space: nowrap !important;
-    }
+        /* Toggle label text - ensure horizontal display */
+        & [data-testid="stCheckbox"] label,
+        & .stCheckbox label {
+            display: flex !important;
+            flex-direction: row !important;
+            align-items: center !important;
+            gap: 0.5rem !important;
+            white-space: nowrap !important;
+        }
 
-    [data-testid="stSidebar"] [data-testid="stCheckbox"] label span,
-    [data-testid="stSidebar"] .stCheckbox label span {
-        writing-mode: horizontal-tb !important;
-        text-orientation: mixed !important;
+        & [data-testid="stCheckbox"] label span,
+        & .stCheckbox label span {
+            writing-mode: horizontal-tb !important;
+            text-orientation: mixed !important;
+        }
     }
 
     /* Generate button - Full width with emphasis */
@@ -870,9 +877,9 @@ def inject_custom_css():
 
     .stTextInput > div > div > input:focus,
     .stTextArea > div > div > textarea:focus {
-        border-color: #10B981 !important;
+        border-color: $accent !important;
         box-shadow:
-            0 0 0 3px rgba(16, 185, 129, 0.1) !important,
+            0 0 0 3px rgba($accent_rgb, 0.1) !important,
             0 1px 3px rgba(0, 0, 0, 0.1) !important;
         outline: none !important;
     }
@@ -903,26 +910,28 @@ def inject_custom_css():
     }
 
     /* Sidebar checkboxes - ensure visibility and proper layout */
-    [data-testid="stSidebar"] .stCheckbox {
-        margin-bottom: 1rem !important;
-    }
+    [data-testid="stSidebar"] {
+        & .stCheckbox {
+            margin-bottom: 1rem !important;
+        }
 
-    [data-testid="stSidebar"] .stCheckbox label {
-        color: var(--text-primary) !important;
-        display: flex !important;
-        align-items: center !important;
-        gap: 0.5rem !important;
-        line-height: 1.5 !important;
-    }
+        & .stCheckbox label {
+            color: var(--text-primary) !important;
+            display: flex !important;
+            align-items: center !important;
+            gap: 0.5rem !important;
+            line-height: 1.5 !important;
+        }
 
-    [data-testid="stSidebar"] .stCheckbox label > span {
-        color: var(--text-primary) !important;
-        white-space: normal !important;
-        word-wrap: break-word !important;
-    }
+        & .stCheckbox label > span {
+            color: var(--text-primary) !important;
+            white-space: normal !important;
+            word-wrap: break-word !important;
+        }
 
-    [data-testid="stSidebar"] .stCheckbox label > div {
-        flex-shrink: 0 !important;
+        & .stCheckbox label > div {
+            flex-shrink: 0 !important;
+        }
     }
 
     /* Radio button group - Segmented control style */
@@ -959,19 +968,21 @@ def inject_custom_css():
     }
 
     /* Sidebar radio buttons - proper spacing and layout */
-    [data-testid="stSidebar"] .stRadio {
-        margin-bottom: 1rem !important;
-    }
+    [data-testid="stSidebar"] {
+        & .stRadio {
+            margin-bottom: 1rem !important;
+        }
 
-    [data-testid="stSidebar"] .stRadio label {
-        color: var(--text-primary) !important;
-        white-space: normal !important;
-        word-wrap: break-word !important;
-    }
+        & .stRadio label {
+            color: var(--text-primary) !important;
+            white-space: normal !important;
+            word-wrap: break-word !important;
+        }
 
-    [data-testid="stSidebar"] .stRadio label span {
-        color: var(--text-primary) !important;
-        font-size: var(--text-sm) !important;
+        & .stRadio label span {
+            color: var(--text-primary) !important;
+            font-size: var(--text-sm) !important;
+        }
     }
 
     /* ===== TABS - Segmented Control Style ===== */
@@ -1009,6 +1020,7 @@ def inject_custom_css():
     .streamlit-expanderHeader {
         font-weight: 500 !important;
         font-size: 0.875rem !important;
+        line-height: 1.4 !important;
         color: var(--text-primary) !important;
         background-color: var(--gray-50) !important;
         border: 1px solid var(--border-subtle) !important;
@@ -1020,12 +1032,9 @@ def inject_custom_css():
         align-items: center !important;
     }
 
-    /* Fix expander text overlap - target the inner span/p */
-    .streamlit-expanderHeader p,
-    .streamlit-expanderHeader span,
-    .streamlit-expanderHeader div {
-        font-size: 0.875rem !important;
-        line-height: 1.4 !important;
+    /* Fix expander text overlap - font-size/line-height inherit from the
+       header; only the direct child needs its box reset */
+    .streamlit-expanderHeader > *:first-child {
         margin: 0 !important;
         padding: 0 !important;
     }
@@ -1045,97 +1054,99 @@ def inject_custom_css():
     }
 
     /* Sidebar expander - Modern minimal style */
-    [data-testid="stSidebar"] .streamlit-expanderHeader {
-        margin-bottom: 0.25rem !important;
-        padding: 0.625rem 0.875rem !important;
-        background: #F8FAFC !important;
-        border: 1px solid rgba(0, 0, 0, 0.06) !important;
-        border-radius: 10px !important;
-        font-size: 0.8125rem !important;
-    }
+    [data-testid="stSidebar"] {
+        & .streamlit-expanderHeader {
+            margin-bottom: 0.25rem !important;
+            padding: 0.625rem 0.875rem !important;
+            background: #F8FAFC !important;
+            border: 1px solid rgba(0, 0, 0, 0.06) !important;
+            border-radius: 10px !important;
+            font-size: 0.8125rem !important;
+        }
 
-    [data-testid="stSidebar"] .streamlit-expanderHeader:hover {
-        background: #F1F5F9 !important;
-        border-color: rgba(16, 185, 129, 0.2) !important;
-    }
+        & .streamlit-expanderHeader:hover {
+            background: #F1F5F9 !important;
+            border-color: rgba($accent_rgb, 0.2) !important;
+        }
 
-    /* Hide material icon text, show only the SVG arrow */
-    [data-testid="stSidebar"] .streamlit-expanderHeader svg {
-        display: block !important;
-        width: 18px !important;
-        height: 18px !important;
-    }
+        /* Hide material icon text, show only the SVG arrow */
+        & .streamlit-expanderHeader svg {
+            display: block !important;
+            width: 18px !important;
+            height: 18px !important;
+        }
 
-    /* Hide keyboard_arrow_down text completely */
-    [data-testid="stSidebar"] .streamlit-expanderHeader p {
-        font-size: 0 !important;
-        line-height: 0 !important;
-        color: transparent !important;
-    }
+        /* Hide keyboard_arrow_down text completely */
+        & .streamlit-expanderHeader p {
+            font-size: 0 !important;
+            line-height: 0 !important;
+            color: transparent !important;
+        }
 
-    /* Hide the arrow text but keep the SVG */
-    [data-testid="stSidebar"] details summary {
-        font-size: 0.8125rem !important;
-    }
+        /* Hide the arrow text but keep the SVG */
+        & details summary {
+            font-size: 0.8125rem !important;
+        }
 
-    [data-testid="stSidebar"] details summary::before {
-        content: '' !important;
-    }
+        & details summary::before {
+            content: '' !important;
+        }
 
-    /* Target the specific text node */
-    [data-testid="stSidebar"] .streamlit-expanderHeader span {
-        font-size: inherit !important;
-    }
+        /* Target the specific text node */
+        & .streamlit-expanderHeader span {
+            font-size: inherit !important;
+        }
 
-    /* Hide just the icon text, not the label */
-    [data-testid="stSidebar"] details summary svg + * {
-        display: none !important;
-    }
+        /* Hide just the icon text, not the label */
+        & details summary svg + * {
+            display: none !important;
+        }
 
-    [data-testid="stSidebar"] .streamlit-expanderContent {
-        margin-bottom: 0.75rem !important;
-        padding: 0.75rem !important;
-        background: transparent !important;
-        border: none !important;
-    }
+        & .streamlit-expanderContent {
+            margin-bottom: 0.75rem !important;
+            padding: 0.75rem !important;
+            background: transparent !important;
+            border: none !important;
+        }
 
-    /* Fix expander details/summary styling */
-    [data-testid="stSidebar"] details[data-testid="stExpander"] > summary {
-        background: #F8FAFC !important;
-        border: 1px solid rgba(0, 0, 0, 0.06) !important;
-        border-radius: 10px !important;
-        padding: 0.625rem 0.875rem !important;
-        list-style: none !important;
-    }
+        /* Fix expander details/summary styling */
+        & details[data-testid="stExpander"] > summary {
+            background: #F8FAFC !important;
+            border: 1px solid rgba(0, 0, 0, 0.06) !important;
+            border-radius: 10px !important;
+            padding: 0.625rem 0.875rem !important;
+            list-style: none !important;
+        }
 
-    [data-testid="stSidebar"] details[data-testid="stExpander"] > summary::-webkit-details-marker {
-        display: none !important;
-    }
+        & details[data-testid="stExpander"] > summary::-webkit-details-marker {
+            display: none !important;
+        }
 
-    [data-testid="stSidebar"] details[data-testid="stExpander"] > summary::marker {
-        display: none !important;
-    }
+        & details[data-testid="stExpander"] > summary::marker {
+            display: none !important;
+        }
 
-    /* Radio buttons in sidebar - segmented control style */
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] {
-        background: #F8FAFC;
-        padding: 0.25rem;
-        border-radius: 10px;
-        border: 1px solid rgba(0, 0, 0, 0.06);
-        gap: 0.25rem;
-    }
+        /* Radio buttons in sidebar - segmented control style */
+        & .stRadio [role="radiogroup"] {
+            background: #F8FAFC;
+            padding: 0.25rem;
+            border-radius: 10px;
+            border: 1px solid rgba(0, 0, 0, 0.06);
+            gap: 0.25rem;
+        }
 
-    [data-testid="stSidebar"] .stRadio label {
-        padding: 0.375rem 0.75rem !important;
-        border-radius: 8px !important;
-        font-size: 0.75rem !important;
-        font-weight: 500 !important;
-    }
+        & .stRadio label {
+            padding: 0.375rem 0.75rem !important;
+            border-radius: 8px !important;
+            font-size: 0.75rem !important;
+            font-weight: 500 !important;
+        }
 
-    [data-testid="stSidebar"] .stRadio label:has(input:checked) {
-        background: white !important;
-        color: #10B981 !important;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1) !important;
+        & .stRadio label:has(input:checked) {
+            background: white !important;
+            color: $accent !important;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1) !important;
+        }
     }
 
     /* Expander content elements spacing */
@@ -1166,55 +1177,54 @@ def inject_custom_css():
     /* ===== SLIDER - Modern Track & Thumb ===== */
     .stSlider {
         padding: var(--space-2) 0;
-    }
-
-    .stSlider > div > div > div > div {
-        background-color: var(--gray-200) !important;
-        height: 4px !important;
-        border-radius: var(--radius-full);
-    }
-
-    .stSlider > div > div > div > div > div {
-        background: linear-gradient(90deg, #10B981, #059669) !important;
-        height: 4px !important;
-        box-shadow: 0 0 8px rgba(16, 185, 129, 0.3) !important;
-    }
 
-    .stSlider > div > div > div > div > div > div {
-        background: linear-gradient(135deg, #10B981, #059669) !important;
-        border: 2px solid var(--pure-white) !important;
-        box-shadow:
-            0 2px 6px rgba(16, 185, 129, 0.3),
-            0 1px 3px rgba(0, 0, 0, 0.2) !important;
-        width: 20px !important;
-        height: 20px !important;
-        top: -8px !important;
-        transition: all var(--transition-fast) !important;
-    }
-
-    .stSlider > div > div > div > div > div > div:hover {
-        transform: scale(1.2);
-        box-shadow:
-            0 4px 12px rgba(16, 185, 129, 0.4),
-            0 2px 6px rgba(0, 0, 0, 0.2) !important;
-    }
+        /* Track */
+        & > div > div > div > div {
+            background-color: var(--gray-200) !important;
+            height: 4px !important;
+            border-radius: var(--radius-full);
+
+            /* Filled range */
+            & > div {
+                background: var(--accent-gradient-horizontal) !important;
+                height: 4px !important;
+                box-shadow: 0 0 8px rgba($accent_rgb, 0.3) !important;
+
+                /* Thumb */
+                & > div {
+                    background: var(--accent-gradient) !important;
+                    border: 2px solid var(--pure-white) !important;
+                    box-shadow: 0 2px 6px rgba($accent_rgb, 0.35) !important;
+                    width: 20px !important;
+                    height: 20px !important;
+                    top: -8px !important;
+                    transition: all var(--transition-fast) !important;
+
+                    &:hover {
+                        transform: scale(1.2);
+                        box-shadow: 0 4px 12px rgba($accent_rgb, 0.45) !important;
+                    }
+                }
+            }
+        }
 
-    /* Slider labels */
-    .stSlider label {
-        color: var(--text-primary) !important;
-        font-size: var(--text-sm) !important;
-        font-weight: 500 !important;
-        margin-bottom: var(--space-2) !important;
+        /* Slider labels */
+        & label {
+            color: var(--text-primary) !important;
+            font-size: var(--text-sm) !important;
+            font-weight: 500 !important;
+            margin-bottom: var(--space-2) !important;
+        }
     }
 
     /* ===== PROGRESS & LOADING - Emerald Theme ===== */
     .stProgress > div > div > div {
-        background: linear-gradient(90deg, #10B981, #059669) !important;
-        box-shadow: 0 0 10px rgba(16, 185, 129, 0.3) !important;
+        background: var(--accent-gradient-horizontal) !important;
+        box-shadow: 0 0 10px rgba($accent_rgb, 0.3) !important;
     }
 
     .stSpinner > div {
-        border-color: var(--border-subtle) var(--border-subtle) #10B981 #10B981 !important;
+        border-color: var(--border-subtle) var(--border-subtle) $accent $accent !important;
     }
 
     /* ===== ALERTS ===== */
@@ -1260,6 +1270,9 @@ def inject_custom_css():
         box-shadow: var(--shadow-xs);
         position: relative;
         overflow: hidden;
+        /* Skip layout/paint for cards scrolled out of view */
+        content-visibility: auto;
+        contain-intrinsic-size: auto 140px;
     }
 
     .studio-card::before {
@@ -1269,16 +1282,16 @@ def inject_custom_css():
         left: 0;
         right: 0;
         height: 3px;
-        background: linear-gradient(90deg, #10B981, #F59E0B, #EC4899);
+        background: linear-gradient(90deg, $accent, $amber, #EC4899);
         opacity: 0;
         transition: opacity var(--transition-base);
     }
 
     .studio-card:hover {
-        border-color: rgba(16, 185, 129, 0.3);
+        border-color: rgba($accent_rgb, 0.3);
         box-shadow:
             var(--shadow-md),
-            0 0 0 1px rgba(16, 185, 129, 0.1);
+            0 0 0 1px rgba($accent_rgb, 0.1);
         transform: translateY(-2px);
     }
 
@@ -1399,7 +1412,7 @@ def inject_custom_css():
     li[role="option"]:hover,
     div[role="option"]:hover,
     [data-baseweb="list-item"]:hover {
-        background-color: rgba(16, 185, 129, 0.1) !important;
+        background-color: rgba($accent_rgb, 0.1) !important;
         color: var(--gray-900) !important;
     }
 
@@ -1408,7 +1421,7 @@ def inject_custom_css():
     [data-baseweb="menu"] li[aria-selected="true"],
     li[role="option"][aria-selected="true"],
     div[role="option"][aria-selected="true"] {
-        background-color: rgba(16, 185, 129, 0.15) !important;
+        background-color: rgba($accent_rgb, 0.15) !important;
         color: var(--gray-900) !important;
         font-weight: 600 !important;
     }
@@ -1467,8 +1480,8 @@ def inject_custom_css():
     [role="listbox"] li[aria-selected="true"],
     [data-testid="stSidebar"] [role="listbox"] li[aria-selected="true"],
     ul[role="listbox"] > li[aria-selected="true"] {
-        background: rgba(16, 185, 129, 0.12) !important;
-        background-color: rgba(16, 185, 129, 0.12) !important;
+        background: rgba($accent_rgb, 0.12) !important;
+        background-color: rgba($accent_rgb, 0.12) !important;
         color: #1E293B !important;
     }
 
@@ -1499,8 +1512,48 @@ def inject_custom_css():
     [role="listbox"] > li {
         background-color: white !important;
     }
-    </style>
-    """, unsafe_allow_html=True)
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    css = css.replace(' !important', '!important')
+    return css.replace(';}', '}').strip()
+
+
+@lru_cache(maxsize=4)
+def _build_stylesheet(theme_key: str = "default") -> str:
+    """Substitute a design-token set into _RAW_CSS and minify the result."""
+    tokens = dict(_DESIGN_TOKENS[theme_key])
+    for name in ("accent", "accent_dark", "amber"):
+        tokens[f"{name}_rgb"] = ", ".join(str(c) for c in hex_to_rgb(tokens[name]))
+    return _minify_css(Template(_RAW_CSS).substitute(tokens))
+
+
+# Built once at import; reruns only re-send the element
+_CSS = f"<style>{_build_stylesheet()}</style>"
+
+
+def inject_custom_css():
+    """
+    Inject production-grade CSS with distinctive aesthetics.
+
+    Call this on every script run. Streamlit drops any element that a
+    rerun does not re-emit, so a once-per-session st.session_state guard
+    would strip the stylesheet after the first interaction. The payload is
+    prebuilt, so re-emitting it is cheap.
+    """
+    if not hasattr(st, "html"):
+        st.markdown(_FONT_LINKS + _CSS, unsafe_allow_html=True)
+        return
+
+    # st.html sanitises away <link> tags, so the Google Fonts links
+    # still go through st.markdown
+    st.markdown(_FONT_LINKS, unsafe_allow_html=True)
+    st.html(_CSS)
 
 
 def render_header():